@@ -12,7 +12,7 @@ def rename_for_jekyll(nb_path: Path, warnings: Set[Tuple[str, str]]=None) -> str
     """
     Return a Path's filename string appended with its modified time in YYYY-MM-DD format.
     """
-    assert nb_path.exists(), f'{nb_path} could not be found.'
+    if not nb_path.exists(): raise FileNotFoundError(f'{nb_path} could not be found.')
 
     # Checks if filename is compliant with Jekyll blog posts
     if _re_blog_date.match(nb_path.name): return nb_path.with_suffix('.md').name.replace(' ', '-')
@@ -23,7 +23,7 @@ def rename_for_jekyll(nb_path: Path, warnings: Set[Tuple[str, str]]=None) -> str
         # Gets the file's last modified time and and append YYYY-MM-DD- to the beginning of the filename
         mdate = os.path.getmtime(nb_path) - 86400 # subtract one day b/c dates in the future break Jekyll
         dtnm = datetime.fromtimestamp(mdate).strftime("%Y-%m-%d-") + clean_name
-        assert _re_blog_date.match(dtnm), f'{dtnm} is not a valid name, filename must be pre-pended with YYYY-MM-DD-'
+        if not _re_blog_date.match(dtnm): raise ValueError(f'{dtnm} is not a valid name, filename must be pre-pended with YYYY-MM-DD-')
         # push this into a set b/c _nb2htmlfname gets called multiple times per conversion
-        if warnings: warnings.add((nb_path, dtnm))
+        if warnings is not None: warnings.add((nb_path, dtnm))
         return dtnm
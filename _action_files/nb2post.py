@@ -1,8 +1,6 @@
 """Converts Jupyter Notebooks to Jekyll compliant blog posts"""
-from datetime import datetime
-import re, os, logging
 from nbdev import export2html
-from nbdev.export2html import Config, Path, _to_html, _re_block_notes
+from nbdev.export2html import Config, Path
 from fast_template import rename_for_jekyll
 
 warnings = set()
@@ -13,10 +11,11 @@ def _nb2htmlfname(nb_path, dest=None):
     if dest is None: dest = Config().doc_path
     return Path(dest)/fname
 
-# TODO: Open a GitHub Issue in addition to printing warnings
-for original, new in warnings:
-    print(f'{original} has been renamed to {new} to be complaint with Jekyll naming conventions.\n')
-    
 ## apply monkey patches
 export2html._nb2htmlfname = _nb2htmlfname
 export2html.notebook2html(fname='_notebooks/*.ipynb', dest='_posts/', template_file='/fastpages/fastpages.tpl', execute=False)
+
+# TODO: Open a GitHub Issue in addition to printing warnings
+if warnings:
+    print('\n'.join(f'{original} has been renamed to {new} to be complaint with Jekyll naming conventions.\n'
+                     for original, new in warnings))
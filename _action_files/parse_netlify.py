@@ -1,7 +1,8 @@
 import sys, re
 logs = sys.stdin.read()
 
-draft_url = re.findall(r'Website Draft URL: .*(https://.*)', logs)[0]
-assert draft_url, 'Was not able to find Draft URL in the logs:\n{}'.format(logs)
+draft_url_match = re.search(r'Website Draft URL: .*(https://.*)', logs)
+if not draft_url_match: raise ValueError('Was not able to find Draft URL in the logs:\n{}'.format(logs))
+draft_url = draft_url_match.group(1)
 print("::set-output name=draft_url::{}".format(draft_url))
 